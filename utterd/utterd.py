@@ -1,8 +1,10 @@
 #!/usr/bin/env -S uv run --script
 # /// script
 # dependencies = [
-#   "websockets>=12.0",
+#   "websockets>=14.0",
 #   "rich>=13.7.0",
+#   "orjson>=3.9.0",
+#   "uvloop>=0.18.0; sys_platform == 'linux'",
 # ]
 # requires-python = ">=3.9"
 # ///
@@ -10,153 +12,442 @@
 utterd - Receives text from Android and simulates keyboard input on Linux
 """
 import asyncio
+import contextlib
+import functools
 import json
+import math
+import os
+import shutil
+import signal
 import subprocess
 import sys
+import time
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+# Rich is imported by RichDisplay and websockets by connect(), so headless
+# runs and failed dependency checks never pay for loading them
+if TYPE_CHECKING:
+    from rich.panel import Panel
+    from websockets.asyncio.client import ClientConnection
+
+try:
+    import orjson
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    json_loads = orjson.loads
+except ImportError:
+    json_dumps = json.dumps
+    json_loads = json.loads
+
+
+@dataclass
+class ClientState:
+    """Everything the displays show, kept together in one place"""
+    status: str = "Initializing..."
+    client_id: Optional[str] = None
+    connection_attempts: int = 0
+    messages_received: int = 0
+    last_text: str = ""
+    last_error: str = ""
+    tool_status: str = ""
+    retry_at: Optional[float] = None  # Monotonic deadline of next attempt
+
+    def status_line(self) -> str:
+        """Current status, including the countdown while waiting to retry"""
+        if self.retry_at is None:
+            return self.status
+        remaining = max(0, math.ceil(self.retry_at - time.monotonic()))
+        return f"{self.status} in {remaining}s..."
+
+
+class NullDisplay:
+    """Display that shows nothing, used as-is when running headless
+
+    Also the base for the other displays: update() is called on the event
+    loop after the client's state changes.
+    """
+
+    # Whether the display renders last_text; if not, the client skips storing it
+    shows_text = False
+
+    def show(self, client: "UtterClient"):
+        """Context manager that keeps the display up while the client runs"""
+        return contextlib.nullcontext()
+
+    def update(self, client: "UtterClient"):
+        pass
+
+    def typed(self, client: "UtterClient", text: str):
+        """Called on the event loop after each successful typing call"""
+        pass
+
+    def stopped(self, client: "UtterClient"):
+        """Called once the client has shut down"""
+        pass
+
+    def dependency_error(self, client: "UtterClient", tool: str):
+        print(
+            f"{client.state.tool_status}\n{client.state.last_error}\n"
+            f"Install command: sudo apt install {tool}",
+            file=sys.stderr
+        )
 
-import websockets
-from websockets.asyncio.client import ClientConnection
-from rich.console import Console
-from rich.live import Live
-from rich.table import Table
-from rich.panel import Panel
-from rich.layout import Layout
-from rich.text import Text
 
+class PlainDisplay(NullDisplay):
+    """Timestamped log lines for status and error changes and typed text"""
+
+    def __init__(self):
+        self.status = ""
+        self.last_error = ""
+
+    def log(self, message: str):
+        print(f"[{datetime.now():%H:%M:%S}] {message}", flush=True)
+
+    def update(self, client: "UtterClient"):
+        state = client.state
+        status = state.status_line()
+        if status != self.status:
+            self.status = status
+            self.log(status)
+
+        if state.last_error != self.last_error:
+            self.last_error = state.last_error
+            if state.last_error:
+                self.log(f"Error: {state.last_error}")
+
+    def typed(self, client: "UtterClient", text: str):
+        # Logged per typing call, so repeating the same text shows up twice
+        self.log(f"↓ {text}")
+
+    def stopped(self, client: "UtterClient"):
+        print("\nShutdown complete")
+
+
+class RichDisplay(NullDisplay):
+    """Live status panel, rebuilt from the client's state when it changes"""
+
+    shows_text = True
+
+    def __init__(self):
+        from rich.console import Console
+        from rich.panel import Panel
+        from rich.style import Style
+        from rich.text import Text
 
-class UtterClient:
-    def __init__(self, server_url: str, use_ydotool: bool = False):
-        self.server_url = server_url
-        self.use_ydotool = use_ydotool
-        self.ws: Optional[ClientConnection] = None
-        self.client_id: Optional[str] = None
         self.console = Console()
 
-        # Status tracking
-        self.status = "Initializing..."
-        self.connection_attempts = 0
-        self.messages_received = 0
-        self.last_text = ""
-        self.last_error = ""
-        self.tool_status = ""
+        # Display pieces that never change, built once instead of per refresh
+        self.ok_style = Style(color="green", bold=True)
+        self.pending_style = Style(color="yellow", bold=True)
+        self.error_style = Style(color="red", bold=True)
+        self.labels = {
+            key: Text(label)
+            for key, label in (
+                ("status", "Status:"),
+                ("server", "Server:"),
+                ("client_id", "Client ID:"),
+                ("tool", "Tool:"),
+                ("messages", "Messages:"),
+                ("last_text", "Last Text:"),
+                ("error", "Error:"),
+            )
+        }
+        self.panel = Panel(
+            "",
+            title="🎤 utterd",
+            border_style="blue",
+            padding=(1, 2)
+        )
 
-    def check_dependencies(self) -> bool:
-        """Check if xdotool or ydotool is installed"""
-        tool = "ydotool" if self.use_ydotool else "xdotool"
-        try:
-            subprocess.run([tool, "--version"], capture_output=True, check=True)
-            self.tool_status = f"✓ {tool} available"
-            return True
-        except FileNotFoundError:
-            self.tool_status = f"✗ {tool} not found"
-            self.last_error = f"Please install {tool}"
-            return False
-        except subprocess.CalledProcessError:
-            self.tool_status = f"✓ {tool} available"
-            return True
+    def show(self, client: "UtterClient"):
+        from rich.live import Live
+        from rich.text import Text
 
-    def simulate_typing(self, text: str):
-        """Simulate keyboard typing using xdotool or ydotool"""
-        try:
-            if self.use_ydotool:
-                subprocess.run(["ydotool", "type", text], check=True)
-            else:
-                subprocess.run(["xdotool", "type", "--", text], check=True)
+        self.server_text = Text(client.server_url)
+        self.dirty = True
 
-            self.last_text = text[:50] + ("..." if len(text) > 50 else "")
-        except subprocess.CalledProcessError as e:
-            self.last_error = f"Typing error: {e}"
-        except Exception as e:
-            self.last_error = f"Unexpected error: {e}"
+        # Live calls generate_display on each refresh; the rows are only
+        # rebuilt after update() has flagged a state change
+        return Live(
+            get_renderable=functools.partial(self.generate_display, client),
+            refresh_per_second=10,
+            console=self.console
+        )
 
-    async def send_message(self, message: dict):
-        """Send a message to the server"""
-        if self.ws:
-            try:
-                await self.ws.send(json.dumps(message))
-            except Exception as e:
-                self.last_error = f"Send error: {e}"
+    def update(self, client: "UtterClient"):
+        self.dirty = True
+
+    def generate_display(self, client: "UtterClient") -> "Panel":
+        """Return the status display, rebuilding its rows if the state changed"""
+        state = client.state
+        if self.dirty:
+            self.dirty = False
+            self.build_rows(state)
+        elif state.retry_at is not None:
+            # Only the countdown moves between state changes
+            self.status_text.plain = state.status_line()
+        return self.panel
+
+    def build_rows(self, state: ClientState):
+        """Rebuild the status table and panel subtitle from the state"""
+        from rich.table import Table
+        from rich.text import Text
 
-    async def handle_message(self, message: dict):
-        """Handle incoming messages from server"""
-        msg_type = message.get("type")
-
-        if msg_type == "connected":
-            self.client_id = message.get("clientId")
-            self.status = "Connected"
-            await self.send_message({
-                "type": "register",
-                "clientType": "linux"
-            })
-
-        elif msg_type == "registered":
-            self.status = "Registered - Ready"
-
-        elif msg_type == "text":
-            content = message.get("content", "")
-            self.messages_received += 1
-            self.simulate_typing(content)
-
-        elif msg_type == "pong":
-            pass  # Silently handle pong
-
-    def generate_display(self) -> Panel:
-        """Generate the status display"""
-        # Create status table
         table = Table.grid(padding=(0, 2))
         table.add_column(style="cyan bold", justify="right")
         table.add_column(style="white")
 
         # Status indicator
-        if self.status in ["Connected", "Registered - Ready"]:
-            status_text = Text(self.status, style="bold green")
-        elif "Connecting" in self.status or "Reconnecting" in self.status:
-            status_text = Text(self.status, style="bold yellow")
+        if state.status in ("Connected", "Registered - Ready"):
+            status_style = self.ok_style
+        elif "Connecting" in state.status or "Reconnecting" in state.status:
+            status_style = self.pending_style
         else:
-            status_text = Text(self.status, style="bold red")
+            status_style = self.error_style
+        self.status_text = Text(state.status_line(), style=status_style)
 
-        table.add_row("Status:", status_text)
-        table.add_row("Server:", self.server_url)
+        labels = self.labels
+        table.add_row(labels["status"], self.status_text)
+        table.add_row(labels["server"], self.server_text)
 
-        if self.client_id:
-            table.add_row("Client ID:", self.client_id)
+        if state.client_id:
+            table.add_row(labels["client_id"], state.client_id)
 
-        table.add_row("Tool:", self.tool_status)
-        table.add_row("Messages:", str(self.messages_received))
+        table.add_row(labels["tool"], state.tool_status)
+        table.add_row(labels["messages"], str(state.messages_received))
 
-        if self.last_text:
-            table.add_row("Last Text:", f"↓ {self.last_text}")
+        if state.last_text:
+            table.add_row(labels["last_text"], f"↓ {state.last_text}")
 
-        if self.last_error:
-            table.add_row("Error:", Text(self.last_error, style="bold red"))
+        if state.last_error:
+            table.add_row(labels["error"], Text(state.last_error, style=self.error_style))
 
-        # Create panel
-        title = "🎤 utterd"
-        if self.status == "Registered - Ready":
+        # Reuse the panel, only its contents and subtitle change
+        if state.status == "Registered - Ready":
             subtitle = "Waiting for voice input from Android..."
         else:
-            subtitle = f"Attempt #{self.connection_attempts}" if self.connection_attempts > 0 else ""
+            subtitle = f"Attempt #{state.connection_attempts}" if state.connection_attempts > 0 else ""
 
-        return Panel(
-            table,
-            title=title,
-            subtitle=subtitle,
-            border_style="blue",
-            padding=(1, 2)
+        self.panel.renderable = table
+        self.panel.subtitle = subtitle
+
+    def stopped(self, client: "UtterClient"):
+        self.console.print("\nShutdown complete")
+
+    def dependency_error(self, client: "UtterClient", tool: str):
+        from rich.panel import Panel
+
+        self.console.print(Panel(
+            f"[red]✗ {client.state.tool_status}[/red]\n\n"
+            f"{client.state.last_error}\n\n"
+            f"Install command:\n"
+            f"  [cyan]sudo apt install {tool}[/cyan]",
+            title="Missing Dependency",
+            border_style="red"
+        ))
+
+
+DISPLAYS = {
+    "rich": RichDisplay,
+    "plain": PlainDisplay,
+    "none": NullDisplay,
+}
+
+
+class UtterClient:
+    def __init__(
+        self,
+        server_url: str,
+        use_ydotool: bool = False,
+        display: Optional["NullDisplay"] = None
+    ):
+        self.server_url = server_url
+        self.use_ydotool = use_ydotool
+        self.ws: Optional["ClientConnection"] = None
+        self.state = ClientState()
+        self.display = display if display is not None else NullDisplay()
+
+        # Typing processes are started ahead of time so the fork/exec and
+        # X11/uinput setup happen while idle, not when text arrives
+        self.typer_proc: Optional[subprocess.Popen] = None
+        self.typing_proc: Optional[subprocess.Popen] = None  # Currently typing
+        self.ydotoold_proc: Optional[subprocess.Popen] = None
+
+        # Message type -> handler, looked up once per frame
+        self.handlers = {
+            "connected": self.on_connected,
+            "registered": self.on_registered,
+            "text": self.on_text,
+        }
+
+        # Text waiting to be typed, drained by a single consumer task
+        self.type_queue: Optional[asyncio.Queue] = None
+
+        # Set by SIGINT/SIGTERM; created in run() on the running loop
+        self.shutdown: Optional[asyncio.Event] = None
+        self.close_task: Optional[asyncio.Future] = None
+        self.connect_task: Optional[asyncio.Future] = None
+        self.typing: Optional[asyncio.Future] = None
+
+    def check_dependencies(self) -> bool:
+        """Check if xdotool or ydotool is installed"""
+        tool = "ydotool" if self.use_ydotool else "xdotool"
+        # PATH lookup only; no need to start the tool just to see it exists
+        if shutil.which(tool):
+            self.state.tool_status = f"✓ {tool} available"
+            return True
+
+        self.state.tool_status = f"✗ {tool} not found"
+        self.state.last_error = f"Please install {tool}"
+        return False
+
+    def spawn_typer(self) -> subprocess.Popen:
+        """Start a typing process that waits on stdin for the next text"""
+        tool = "ydotool" if self.use_ydotool else "xdotool"
+        return subprocess.Popen(
+            [tool, "type", "--file", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            bufsize=0
         )
 
-    async def connect(self, live):
+    def ydotoold_running(self) -> bool:
+        """Check whether a ydotoold socket is already listening"""
+        runtime_dir = os.environ.get("XDG_RUNTIME_DIR", "/tmp")
+        candidates = [
+            os.environ.get("YDOTOOL_SOCKET"),
+            os.path.join(runtime_dir, ".ydotool_socket"),
+            "/tmp/.ydotool_socket",
+        ]
+        return any(path and os.path.exists(path) for path in candidates)
+
+    def start_typer(self):
+        """Start the long-lived typing helpers"""
+        if self.use_ydotool and not self.ydotoold_running():
+            try:
+                self.ydotoold_proc = subprocess.Popen(
+                    ["ydotoold"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+            except FileNotFoundError:
+                pass  # Older ydotool releases type without a daemon
+
+        self.typer_proc = self.spawn_typer()
+
+    def stop_typer(self):
+        """Terminate the typing helpers started by this client"""
+        for proc in (self.typing_proc, self.typer_proc, self.ydotoold_proc):
+            if proc and proc.poll() is None:
+                proc.terminate()
+                proc.wait()
+        self.typing_proc = None
+        self.typer_proc = None
+        self.ydotoold_proc = None
+
+    def simulate_typing(self, text: str) -> bool:
+        """Simulate keyboard typing using xdotool or ydotool
+
+        Returns True if the text was typed.
+        """
+        try:
+            proc = self.typer_proc
+            if proc is None or proc.poll() is not None:
+                # Spare process died or was never started
+                proc = self.spawn_typer()
+            self.typing_proc = proc
+
+            # Write straight to the pipe fd, bypassing the file object
+            data = memoryview(text.encode())
+            fd = proc.stdin.fileno()
+            while data:
+                data = data[os.write(fd, data):]
+            proc.stdin.close()
+
+            # Warm up the next process while this one types
+            self.typer_proc = self.spawn_typer()
+
+            if proc.wait() != 0:
+                raise subprocess.CalledProcessError(proc.returncode, proc.args)
+
+            if self.display.shows_text:
+                self.state.last_text = text if len(text) <= 50 else text[:47] + "..."
+            return True
+        except subprocess.CalledProcessError as e:
+            self.state.last_error = f"Typing error: {e}"
+        except Exception as e:
+            self.state.last_error = f"Unexpected error: {e}"
+        return False
+
+    async def type_queued_text(self):
+        """Type queued text, joining everything that arrived in the meantime"""
+        while True:
+            chunks = [await self.type_queue.get()]
+            while True:
+                try:
+                    chunks.append(self.type_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            # Shielded: cancelling this task can't stop the worker thread, so
+            # run() waits on self.typing before tearing down the typing processes
+            self.typing = asyncio.ensure_future(self.type_text("".join(chunks)))
+            await asyncio.shield(self.typing)
+
+    async def type_text(self, text: str):
+        """Type text in a worker thread so pings and display refresh keep running"""
+        if await asyncio.to_thread(self.simulate_typing, text):
+            self.display.typed(self, text)
+        self.display.update(self)
+
+    async def send_message(self, message: dict):
+        """Send a message to the server"""
+        if self.ws:
+            try:
+                await self.ws.send(json_dumps(message))
+            except Exception as e:
+                self.state.last_error = f"Send error: {e}"
+
+    async def on_connected(self, message: dict):
+        self.state.client_id = message.get("clientId")
+        self.state.status = "Connected"
+        await self.send_message({
+            "type": "register",
+            "clientType": "linux"
+        })
+
+    async def on_registered(self, message: dict):
+        self.state.status = "Registered - Ready"
+
+    async def on_text(self, message: dict):
+        content = message.get("content", "")
+        self.state.messages_received += 1
+        self.type_queue.put_nowait(content)
+
+    async def handle_message(self, message: dict):
+        """Handle incoming messages from server"""
+        # Unknown types and pongs have no handler and are ignored
+        handler = self.handlers.get(message.get("type"))
+        if handler:
+            await handler(message)
+
+    async def connect(self):
         """Connect to the relay server and listen for messages"""
-        self.connection_attempts += 1
-        self.status = "Connecting..."
-        self.last_error = ""
-        live.update(self.generate_display())
+        import websockets
+
+        self.state.connection_attempts += 1
+        self.state.status = "Connecting..."
+        self.state.last_error = ""
 
         # Clear previous connection state
         self.ws = None
-        self.client_id = None
+        self.state.client_id = None
+        self.display.update(self)
 
         try:
             # Connect with timeout and ping/pong for keepalive
@@ -164,106 +455,149 @@ class UtterClient:
                 self.server_url,
                 ping_interval=5,   # Send ping every 5 seconds
                 ping_timeout=5,    # Wait 5 seconds for pong
-                close_timeout=3    # Wait 3 seconds for close handshake
+                close_timeout=3,   # Wait 3 seconds for close handshake
+                compression=None   # Frames are tiny; deflate costs more than it saves
             ) as ws:
                 self.ws = ws
-                self.status = "Connected"
-                live.update(self.generate_display())
+                self.state.status = "Connected"
+                self.display.update(self)
 
-                # Message loop - will exit on disconnect
-                async for message in ws:
+                # Message loop - will exit on disconnect. Frames stay bytes
+                # (no UTF-8 decode to str); the JSON decoder reads bytes directly
+                while not self.shutdown.is_set():
+                    message = await ws.recv(decode=False)
                     try:
-                        data = json.loads(message)
+                        data = json_loads(message)
                         await self.handle_message(data)
-                        # Update display after handling message
-                        live.update(self.generate_display())
                     except json.JSONDecodeError:
-                        self.last_error = "Invalid JSON received"
-                        live.update(self.generate_display())
+                        self.state.last_error = "Invalid JSON received"
                     except Exception as e:
-                        self.last_error = f"Handler error: {e}"
-                        live.update(self.generate_display())
+                        self.state.last_error = f"Handler error: {e}"
+
+                    self.display.update(self)
 
         except websockets.exceptions.ConnectionClosedOK:
-            self.status = "Disconnected"
-            self.last_error = "Connection closed normally"
+            self.state.status = "Disconnected"
+            self.state.last_error = "Connection closed normally"
         except websockets.exceptions.ConnectionClosedError as e:
-            self.status = "Disconnected"
+            self.state.status = "Disconnected"
             if e.rcvd:
-                self.last_error = f"Server closed: {e.rcvd.reason or 'no reason'}"
+                self.state.last_error = f"Server closed: {e.rcvd.reason or 'no reason'}"
             else:
-                self.last_error = "Connection lost unexpectedly"
+                self.state.last_error = "Connection lost unexpectedly"
         except (ConnectionRefusedError, OSError) as e:
-            self.status = "Connection Refused"
+            self.state.status = "Connection Refused"
             if "111" in str(e) or "Connection refused" in str(e):
-                self.last_error = "Server not running - start relay server first"
+                self.state.last_error = "Server not running - start relay server first"
             else:
-                self.last_error = "Cannot connect to server"
+                self.state.last_error = "Cannot connect to server"
         except asyncio.TimeoutError:
-            self.status = "Timeout"
-            self.last_error = "Connection timeout - server not responding"
+            self.state.status = "Timeout"
+            self.state.last_error = "Connection timeout - server not responding"
         except Exception as e:
-            self.status = "Connection Error"
+            self.state.status = "Connection Error"
             # Show simpler error message
             error_str = str(e)
             if "Multiple exceptions" in error_str:
-                self.last_error = "Server not reachable - check server URL"
+                self.state.last_error = "Server not reachable - check server URL"
             elif "getaddrinfo failed" in error_str:
-                self.last_error = "Cannot resolve hostname"
+                self.state.last_error = "Cannot resolve hostname"
             else:
-                self.last_error = error_str[:80]  # Truncate long errors
+                self.state.last_error = error_str[:80]  # Truncate long errors
         finally:
             # Always clear connection state on exit
             self.ws = None
-            if not self.client_id:
+            if not self.state.client_id:
                 # Only clear if we never got registered
                 pass
+            self.display.update(self)
+
+    async def wait_to_retry(self, status: str, delay: int = 5):
+        """Wait before the next connection attempt, or until shutdown
+
+        Displays derive the countdown from retry_at via state.status_line().
+        """
+        if self.shutdown.is_set():
+            return
+
+        self.state.status = status
+        self.state.retry_at = time.monotonic() + delay
+        self.display.update(self)
+        try:
+            await asyncio.wait_for(self.shutdown.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+        self.state.retry_at = None
+
+    def request_shutdown(self):
+        """Signal handler: stop reconnecting and close the connection
+
+        A second signal force-quits: the typing processes are killed so the
+        worker thread returns, and KeyboardInterrupt unwinds the loop.
+        """
+        if self.shutdown.is_set():
+            self.stop_typer()
+            raise KeyboardInterrupt
+
+        self.shutdown.set()
+        if self.ws:
+            # Closing makes the pending recv() in connect() return
+            self.close_task = asyncio.ensure_future(self.ws.close())
+        elif self.connect_task:
+            # Still handshaking; don't wait for the open timeout
+            self.connect_task.cancel()
 
     async def run_with_display(self):
-        """Main run loop with live display"""
-        with Live(self.generate_display(), refresh_per_second=10, console=self.console) as live:
-            while True:
+        """Main run loop, reconnecting until shutdown is requested"""
+        with self.display.show(self):
+            while not self.shutdown.is_set():
                 try:
-                    # Try to connect (pass live so it can update display)
-                    await self.connect(live)
-
-                    # Update display after disconnect
-                    live.update(self.generate_display())
-
-                    # Countdown before reconnecting
-                    reconnect_delay = 5
-                    for remaining in range(reconnect_delay, 0, -1):
-                        self.status = f"Reconnecting in {remaining}s..."
-                        live.update(self.generate_display())
-                        await asyncio.sleep(1)
-
-                except KeyboardInterrupt:
-                    self.status = "Shutting down..."
-                    live.update(self.generate_display())
-                    break
+                    self.connect_task = asyncio.ensure_future(self.connect())
+                    try:
+                        await self.connect_task
+                    finally:
+                        self.connect_task = None
+                    await self.wait_to_retry("Reconnecting")
+                except asyncio.CancelledError:
+                    # Cancelled by request_shutdown; anything else propagates
+                    if not self.shutdown.is_set():
+                        raise
                 except Exception as e:
-                    self.last_error = f"Fatal error: {e}"
-                    live.update(self.generate_display())
-                    # Wait before retry on fatal error
-                    for remaining in range(5, 0, -1):
-                        self.status = f"Retrying in {remaining}s..."
-                        live.update(self.generate_display())
-                        await asyncio.sleep(1)
+                    self.state.last_error = f"Fatal error: {e}"
+                    await self.wait_to_retry("Retrying")
+
+            self.state.status = "Shutting down..."
+            self.display.update(self)
 
     async def run(self):
         """Main entry point"""
         if not self.check_dependencies():
-            self.console.print(Panel(
-                f"[red]✗ {self.tool_status}[/red]\n\n"
-                f"{self.last_error}\n\n"
-                f"Install command:\n"
-                f"  [cyan]sudo apt install {'ydotool' if self.use_ydotool else 'xdotool'}[/cyan]",
-                title="Missing Dependency",
-                border_style="red"
-            ))
+            tool = "ydotool" if self.use_ydotool else "xdotool"
+            self.display.dependency_error(self, tool)
             return
 
-        await self.run_with_display()
+        self.shutdown = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self.request_shutdown)
+
+        self.start_typer()
+        self.type_queue = asyncio.Queue()
+        typer_task = asyncio.create_task(self.type_queued_text())
+        try:
+            await self.run_with_display()
+        finally:
+            # Let an in-flight typing call finish, so it can't start a new
+            # spare after stop_typer(). Text still queued behind it is
+            # dropped: the user asked to stop, so don't keep typing into
+            # whatever window has focus
+            typer_task.cancel()
+            await asyncio.wait([typer_task])
+            if self.typing is not None:
+                await asyncio.wait([self.typing])
+            self.stop_typer()
+
+        self.display.stopped(self)
 
 
 def main():
@@ -278,6 +612,7 @@ Examples:
   %(prog)s                              # Connect to localhost
   %(prog)s --server ws://192.168.1.5:8080  # Connect to remote server
   %(prog)s --ydotool                    # Use ydotool (Wayland)
+  %(prog)s --ui plain                   # Log lines instead of a live panel
         """
     )
     parser.add_argument(
@@ -290,15 +625,28 @@ Examples:
         action="store_true",
         help="Use ydotool instead of xdotool (for Wayland)"
     )
+    parser.add_argument(
+        "--ui",
+        choices=DISPLAYS,
+        default="rich",
+        help="Status display: live panel, log lines, or none (default: rich)"
+    )
 
     args = parser.parse_args()
 
-    client = UtterClient(args.server, args.ydotool)
+    client = UtterClient(args.server, args.ydotool, DISPLAYS[args.ui]())
 
+    # uvloop's transports have lower per-frame overhead than asyncio's
     try:
-        asyncio.run(client.run())
+        import uvloop
+        run = uvloop.run
+    except ImportError:
+        run = asyncio.run
+
+    try:
+        run(client.run())
     except KeyboardInterrupt:
-        print("\nShutdown complete")
+        client.display.stopped(client)
 
 
 if __name__ == "__main__":